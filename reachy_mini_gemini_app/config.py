@@ -1,16 +1,30 @@
 """Configuration management for Reachy Mini Gemini App."""
 
 import json
+import logging
 import os
+import tempfile
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Union
+
+# Try to import orjson (optional, faster JSON parsing/encoding)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+logger = logging.getLogger(__name__)
 
 # Config file location - use XDG_CONFIG_HOME or fallback to ~/.config
 CONFIG_DIR = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")) / "reachy-mini-gemini"
 CONFIG_FILE = CONFIG_DIR / "settings.json"
 
-# Default settings
-DEFAULT_SETTINGS = {
+# Default settings (read-only; copy before modifying)
+DEFAULT_SETTINGS = MappingProxyType({
     "api_key": None,
     "robot_audio": False,
     "use_camera": True,
@@ -22,7 +36,59 @@ DEFAULT_SETTINGS = {
     "camera_fps": 1.0,
     "jpeg_quality": 50,
     "camera_width": 640,
-}
+})
+
+# Parsed contents of CONFIG_FILE, keyed by the file's mtime so repeated reads
+# (e.g. every GET /api/settings) skip the stat+open+json.loads round trip
+_cache: Dict[str, Any] = {"mtime": None, "data": None}
+_cache_lock = threading.Lock()
+
+# Effective settings (defaults + file + pending updates + env), keyed by
+# (mtime, env API key, pending version)
+_settings_cache: Dict[str, Any] = {"key": None, "data": None}
+
+# Settings reported by GET /api/settings, besides "api_key_set"
+_API_KEYS = (
+    "robot_audio",
+    "use_camera",
+    "holiday_cheer",
+    "mic_gain",
+    "chunk_size",
+    "send_queue_size",
+    "recv_queue_size",
+    "camera_fps",
+    "jpeg_quality",
+    "camera_width",
+)
+
+# Serialized GET /api/settings body, keyed by (mtime, env key set, pending version)
+_api_cache: Dict[str, Any] = {"key": None, "data": None}
+
+# Seconds to wait for more updates before writing queued settings to disk
+SAVE_DELAY = 0.2
+
+# Updates queued by queue_settings_update() that haven't been written yet
+_pending: Dict[str, Any] = {"data": {}, "version": 0, "timer": None}
+_pending_lock = threading.Lock()
+
+
+def loads_json(data: Union[bytes, bytearray, str]) -> Any:
+    """Parse JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(data: Any, indent: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON, using orjson when available.
+
+    Args:
+        data: Object to encode
+        indent: Pretty-print with a two-space indent instead of compact output
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(data, indent=2 if indent else None).encode("utf-8")
 
 
 def ensure_config_dir() -> None:
@@ -30,82 +96,185 @@ def ensure_config_dir() -> None:
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def load_settings() -> Dict[str, Any]:
-    """Load settings from the config file."""
-    settings = DEFAULT_SETTINGS.copy()
+def _config_mtime() -> Optional[int]:
+    """Return the config file's mtime in nanoseconds, or None if it doesn't exist."""
+    try:
+        return CONFIG_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_config_file(mtime: Optional[int] = None) -> Dict[str, Any]:
+    """Return the parsed config file, re-reading it only when its mtime changes.
+
+    Args:
+        mtime: The file's current mtime, if the caller has already stat'ed it
+    """
+    if mtime is None:
+        mtime = _config_mtime()
+
+    with _cache_lock:
+        if _cache["data"] is not None and _cache["mtime"] == mtime:
+            return _cache["data"]
+
+        file_settings: Dict[str, Any] = {}
+        if mtime is not None:
+            try:
+                with open(CONFIG_FILE, "rb") as f:
+                    file_settings = loads_json(f.read())
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning("Failed to load settings from %s: %s", CONFIG_FILE, e)
 
-    # First check environment variable for API key
+        _cache["mtime"] = mtime
+        _cache["data"] = file_settings
+        return file_settings
+
+
+def _current_settings() -> Dict[str, Any]:
+    """Return the cached effective settings. Callers must not modify the result."""
+    mtime = _config_mtime()
     env_api_key = os.environ.get("GOOGLE_API_KEY")
+    key = (mtime, env_api_key, _pending["version"])
+
+    with _cache_lock:
+        if _settings_cache["data"] is not None and _settings_cache["key"] == key:
+            return _settings_cache["data"]
+
+    settings = dict(DEFAULT_SETTINGS)
+
+    # Apply the config file, then queued updates that haven't been flushed yet
+    settings.update(_read_config_file(mtime))
+    with _pending_lock:
+        settings.update(_pending["data"])
+
+    # The environment variable takes precedence over the file for the API key
     if env_api_key:
         settings["api_key"] = env_api_key
 
-    # Then load from config file (file settings override defaults but not env)
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE, "r") as f:
-                file_settings = json.load(f)
-                # Don't override API key from env
-                if env_api_key and "api_key" in file_settings:
-                    del file_settings["api_key"]
-                settings.update(file_settings)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Warning: Failed to load settings from {CONFIG_FILE}: {e}")
-
+    with _cache_lock:
+        _settings_cache["key"] = key
+        _settings_cache["data"] = settings
     return settings
 
 
-def save_settings(settings: Dict[str, Any]) -> bool:
-    """Save settings to the config file."""
+def load_settings() -> Dict[str, Any]:
+    """Load settings from the config file."""
+    return dict(_current_settings())
+
+
+def save_settings(settings: Dict[str, Any], durable: bool = False) -> bool:
+    """Save settings to the config file.
+
+    The update is merged with the cached file contents and written to a
+    temporary file that atomically replaces CONFIG_FILE.
+
+    Args:
+        settings: Settings to update
+        durable: fsync the file and its directory so the write survives a crash
+    """
+    tmp_name = None
     try:
         ensure_config_dir()
 
-        # Load existing settings to preserve any we're not updating
-        existing = {}
-        if CONFIG_FILE.exists():
-            try:
-                with open(CONFIG_FILE, "r") as f:
-                    existing = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
+        # Merge with existing settings to preserve any we're not updating
+        merged = {**_read_config_file(), **settings}
+
+        # Write to a temporary file, then swap it in so readers never see a partial file
+        with tempfile.NamedTemporaryFile(
+            dir=CONFIG_DIR, prefix=".settings-", suffix=".tmp", delete=False
+        ) as f:
+            tmp_name = f.name
+            f.write(dumps_json(merged, indent=True))
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_name, CONFIG_FILE)
+        tmp_name = None
 
-        # Update with new settings
-        existing.update(settings)
+        if durable:
+            dir_fd = os.open(CONFIG_DIR, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
 
-        # Write back
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(existing, f, indent=2)
+        with _cache_lock:
+            _cache["mtime"] = _config_mtime()
+            _cache["data"] = merged
+            _settings_cache["data"] = None
+            _api_cache["data"] = None
 
         return True
     except IOError as e:
-        print(f"Error saving settings: {e}")
+        logger.error("Error saving settings: %s", e)
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
         return False
 
 
+def queue_settings_update(settings: Dict[str, Any]) -> None:
+    """Queue settings to be saved, coalescing rapid updates into one write.
+
+    Updates are merged in memory (and visible to load_settings() right away)
+    and written to disk SAVE_DELAY seconds after the first queued update.
+    """
+    with _pending_lock:
+        _pending["data"].update(settings)
+        _pending["version"] += 1
+
+        if _pending["timer"] is None:
+            timer = threading.Timer(SAVE_DELAY, flush_settings)
+            timer.daemon = True
+            _pending["timer"] = timer
+            timer.start()
+
+
+def flush_settings() -> bool:
+    """Write any queued settings updates to disk now."""
+    with _pending_lock:
+        timer = _pending["timer"]
+        _pending["timer"] = None
+        if timer is not None:
+            timer.cancel()
+
+        if not _pending["data"]:
+            return True
+
+        if not save_settings(_pending["data"]):
+            return False
+
+        _pending["data"] = {}
+        return True
+
+
 def get_api_key() -> Optional[str]:
     """Get the API key from environment or config file."""
     # Environment variable takes precedence
-    env_key = os.environ.get("GOOGLE_API_KEY")
-    if env_key:
-        return env_key
-
-    # Fall back to config file
-    settings = load_settings()
-    return settings.get("api_key")
+    return os.environ.get("GOOGLE_API_KEY") or _current_settings().get("api_key")
 
 
 def get_settings_for_api() -> Dict[str, Any]:
     """Get settings formatted for the API response (hides actual API key)."""
-    settings = load_settings()
-    return {
-        "api_key_set": bool(settings.get("api_key")),
-        "robot_audio": settings.get("robot_audio", False),
-        "use_camera": settings.get("use_camera", True),
-        "holiday_cheer": settings.get("holiday_cheer", False),
-        "mic_gain": settings.get("mic_gain", 3.0),
-        "chunk_size": settings.get("chunk_size", 512),
-        "send_queue_size": settings.get("send_queue_size", 5),
-        "recv_queue_size": settings.get("recv_queue_size", 8),
-        "camera_fps": settings.get("camera_fps", 1.0),
-        "jpeg_quality": settings.get("jpeg_quality", 50),
-        "camera_width": settings.get("camera_width", 640),
-    }
+    settings = _current_settings()
+    api_settings = {"api_key_set": bool(settings.get("api_key"))}
+    api_settings.update({key: settings.get(key) for key in _API_KEYS})
+    return api_settings
+
+
+def get_settings_api_bytes() -> bytes:
+    """Get the JSON-encoded API settings, re-serialized only when settings change."""
+    key = (_config_mtime(), bool(os.environ.get("GOOGLE_API_KEY")), _pending["version"])
+
+    with _cache_lock:
+        if _api_cache["data"] is not None and _api_cache["key"] == key:
+            return _api_cache["data"]
+
+    data = dumps_json(get_settings_for_api())
+
+    with _cache_lock:
+        _api_cache["key"] = key
+        _api_cache["data"] = data
+    return data
@@ -12,15 +12,12 @@ import threading
 import time
 from typing import Optional
 
-from dotenv import load_dotenv
-
-load_dotenv()
-
+# Needed at import time for the ReachyMiniGeminiApp base class. The Gemini
+# handler, movement controller and dotenv are imported lazily in
+# run_conversation() so `--help` and argument errors return quickly.
 from reachy_mini import ReachyMini, ReachyMiniApp
 
 from reachy_mini_gemini_app.config import get_api_key, load_settings
-from reachy_mini_gemini_app.gemini_handler import GeminiLiveHandler
-from reachy_mini_gemini_app.movements import MovementController
 from reachy_mini_gemini_app.web_server import start_settings_server, stop_settings_server
 
 logging.basicConfig(level=logging.INFO)
@@ -120,6 +117,12 @@ async def run_conversation(
     args: argparse.Namespace,
 ) -> None:
     """Run the main conversation loop."""
+    from dotenv import load_dotenv
+
+    from reachy_mini_gemini_app.gemini_handler import GeminiLiveHandler
+    from reachy_mini_gemini_app.movements import MovementController
+
+    load_dotenv()
 
     api_key = get_api_key()
     if not api_key:
@@ -161,17 +164,26 @@ async def run_conversation(
         raise
     finally:
         await handler.close()
+        movement_controller.close()
 
 
 def run(
     robot: Optional[ReachyMini] = None,
     stop_event: Optional[threading.Event] = None,
+    args: Optional[argparse.Namespace] = None,
 ) -> None:
-    """Run the Gemini conversation app."""
-    args = parse_args()
+    """Run the Gemini conversation app.
 
-    if args.debug:
-        logging.getLogger().setLevel(logging.DEBUG)
+    Args:
+        robot: ReachyMini instance, created from the arguments if not given
+        stop_event: Event to signal when to stop
+        args: Already-parsed command line arguments, parsed here if not given
+    """
+    if args is None:
+        args = parse_args()
+
+        if args.debug:
+            logging.getLogger().setLevel(logging.DEBUG)
 
     if robot is None:
         robot = create_robot(args)
@@ -195,12 +207,15 @@ class ReachyMiniGeminiApp(ReachyMiniApp):
     custom_app_url = "http://0.0.0.0:8042"  # Settings page URL
     dont_start_webserver = False
 
+    # The dashboard may open the settings page from another machine
+    settings_host = "0.0.0.0"
+
     def run(self, reachy_mini: ReachyMini, stop_event: threading.Event) -> None:
         """Run the app."""
         # Start the settings web server
         try:
-            start_settings_server(port=8042)
-            logger.info("Settings page available at http://0.0.0.0:8042")
+            url = start_settings_server(port=8042, host=self.settings_host)
+            logger.info(f"Settings page available at {url}")
         except Exception as e:
             logger.warning(f"Could not start settings server: {e}")
 
@@ -294,7 +309,7 @@ def main() -> None:
     stop_event = threading.Event()
 
     try:
-        run(robot=robot, stop_event=stop_event)
+        run(robot=robot, stop_event=stop_event, args=args)
     except KeyboardInterrupt:
         logger.info("Shutting down...")
         stop_event.set()
@@ -5,16 +5,251 @@ can use as tools during conversation.
 """
 
 import asyncio
+import functools
 import logging
-from typing import Optional, Tuple
+import math
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
 from reachy_mini import ReachyMini
-from reachy_mini.utils import create_head_pose
 
 logger = logging.getLogger(__name__)
 
+_DEG2RAD = math.pi / 180.0
+
+# Seconds between flushes of motion errors recorded on the worker to the log
+_ERROR_LOG_INTERVAL = 1.0
+
+# Antenna angle limit in radians (either direction)
+_ANT_LIMIT = math.pi / 2
+
+# Antenna (right, left) angles in radians for each antenna_expression preset
+_ANTENNA_PRESETS: Dict[str, Tuple[float, float]] = {
+    "neutral": (0.0, 0.0),
+    "alert": (0.8, -0.8),       # Both up/forward
+    "droopy": (-1.0, 1.0),      # Both down
+    "asymmetric": (0.5, 0.2),   # One up, one down
+    "perky": (1.0, -1.0),       # Both fully up
+}
+
+# Fixed (roll, pitch, yaw) head orientations, in degrees, used outside gestures
+_STATIC_POSE_ANGLES = (
+    (0, 0, 0),
+    # move_head
+    (0, 0, 25), (0, 0, -25), (0, -20, 0), (0, 20, 0),
+)
+
+# One gesture step: head pose matrix (or None), antenna (right, left) angles in
+# radians (or None), move duration and pause afterwards, both in seconds
+StepRecord = namedtuple("StepRecord", "head antennas duration dwell")
+
+# Gesture steps as ((roll, pitch, yaw) in degrees, antennas, duration, dwell).
+# "nod" and "shake" are single cycles, repeated and followed by "recenter".
+_GESTURE_SPECS = {
+    "nod": (
+        ((0, 15, 0), None, 0.15, 0.1),      # Nod down
+        ((0, -10, 0), None, 0.15, 0.1),     # Nod up
+    ),
+    "shake": (
+        ((0, 0, 20), None, 0.15, 0.05),     # Turn left
+        ((0, 0, -20), None, 0.15, 0.05),    # Turn right
+    ),
+    "recenter": (
+        ((0, 0, 0), None, 0.2, 0.0),
+    ),
+    "happy": (
+        ((15, 0, 0), (0.5, -0.5), 0.2, 0.15),   # Quick head tilt right
+        ((-15, 0, 0), (-0.5, 0.5), 0.2, 0.15),  # Quick head tilt left
+        ((0, 0, 0), (0.3, -0.3), 0.2, 0.0),     # Back to center with perky antennas
+    ),
+    "sad": (
+        ((0, 25, 0), (-1.2, 1.2), 0.8, 0.8),    # Look down with droopy antennas
+        ((0, 5, 0), (-0.3, 0.3), 0.5, 0.0),     # Slowly return to slightly droopy neutral
+    ),
+    "surprised": (
+        ((0, -20, 0), (1.0, -1.0), 0.12, 0.4),  # Quick look up with antennas up
+        ((0, 0, 0), (0.3, -0.3), 0.3, 0.0),     # Return to neutral with slightly raised antennas
+    ),
+    "curious": (
+        ((20, -10, 0), (0.6, 0.1), 0.4, 0.5),   # Tilt head to side with one antenna up
+        ((0, 0, 0), (0.0, 0.0), 0.3, 0.0),      # Return to neutral
+    ),
+    "excited": (
+        ((0, -10, 0), (0.8, -0.8), 0.1, 0.08),  # Quick up
+        ((0, 5, 0), (-0.2, 0.2), 0.1, 0.08),    # Quick down
+    ) * 3 + (
+        ((0, 0, 0), (0.5, -0.5), 0.2, 0.0),     # End with perky pose
+    ),
+    "sleepy": (
+        ((8, 25, 0), (-1.3, 1.3), 1.2, 0.5),    # Slowly droop head and antennas
+        ((8, 30, 0), None, 0.3, 0.3),           # Small "nod off" movement
+        ((0, 15, 0), (-0.8, 0.8), 0.4, 0.0),    # Wake up slightly
+    ),
+    "confused": (
+        ((15, -5, 0), (0.4, 0.6), 0.3, 0.3),    # Tilt one way
+        ((-15, -5, 0), (0.6, 0.4), 0.3, 0.3),   # Tilt other way
+        ((8, 0, 0), (0.2, 0.4), 0.25, 0.0),     # Return to slightly confused pose
+    ),
+    "angry": (
+        ((0, 10, 0), (0.8, -0.8), 0.2, 0.2),    # Look down intensely
+        ((0, 10, 10), None, 0.1, 0.1),          # Quick shake
+        ((0, 10, -10), None, 0.1, 0.1),
+        ((0, 5, 0), (0.5, -0.5), 0.2, 0.0),     # Return to stern pose
+    ),
+    "love": (
+        ((12, -8, 0), (0.4, -0.4), 0.5, 0.4),   # Gentle tilt with soft antenna pose
+        ((-12, -8, 0), (-0.4, 0.4), 0.5, 0.4),  # Other side
+        ((0, 0, 0), (0.2, -0.2), 0.3, 0.0),     # Return to happy neutral
+    ),
+    # Default/happy dance
+    "dance": (
+        ((15, -5, 0), (0.6, -0.6), 0.15, 0.1),
+        ((-15, -5, 0), (-0.6, 0.6), 0.15, 0.1),
+    ) * 3 + (
+        ((0, 0, 0), (0.0, 0.0), 0.25, 0.0),     # Return to neutral
+    ),
+    # Silly dance with exaggerated movements
+    "dance_silly": (
+        ((25, 0, 15), (1.0, 0.0), 0.2, 0.15),
+        ((-25, 0, -15), (0.0, -1.0), 0.2, 0.15),
+    ) * 2 + (
+        ((0, 0, 0), (0.0, 0.0), 0.25, 0.0),     # Return to neutral
+    ),
+}
+
+# Gestures accepted by express_emotion
+_EMOTIONS = frozenset((
+    "happy", "sad", "surprised", "curious", "excited",
+    "sleepy", "confused", "angry", "love",
+))
+
+
+def _clip(x: float, lo: float, hi: float) -> float:
+    """Clamp `x` to the range [lo, hi]. NaN, which fails both comparisons, maps to `lo`."""
+    if x != x:
+        return lo
+    return lo if x < lo else hi if x > hi else x
+
+
+def _fill_pose(out: np.ndarray, roll, pitch, yaw) -> np.ndarray:
+    """Write head pose matrices into `out` in place.
+
+    Matches reachy_mini.utils.create_head_pose (extrinsic xyz Euler angles,
+    i.e. R = Rz(yaw) @ Ry(pitch) @ Rx(roll), zero translation), but writes the
+    closed-form rotation entries directly instead of composing matrices.
+
+    Args:
+        out: (4, 4) array for scalar angles, or (N, 4, 4) for length-N arrays
+        roll: Roll angle(s) in degrees
+        pitch: Pitch angle(s) in degrees
+        yaw: Yaw angle(s) in degrees
+
+    Returns:
+        `out`
+    """
+    a, b, c = np.deg2rad(roll), np.deg2rad(pitch), np.deg2rad(yaw)
+    ca, sa = np.cos(a), np.sin(a)
+    cb, sb = np.cos(b), np.sin(b)
+    cc, sc = np.cos(c), np.sin(c)
+
+    out[..., 0, 0] = cb * cc
+    out[..., 0, 1] = sa * sb * cc - ca * sc
+    out[..., 0, 2] = ca * sb * cc + sa * sc
+    out[..., 1, 0] = cb * sc
+    out[..., 1, 1] = sa * sb * sc + ca * cc
+    out[..., 1, 2] = ca * sb * sc - sa * cc
+    out[..., 2, 0] = -sb
+    out[..., 2, 1] = sa * cb
+    out[..., 2, 2] = ca * cb
+    out[..., :3, 3] = 0.0
+    out[..., 3, :] = (0.0, 0.0, 0.0, 1.0)
+    return out
+
+
+def _build_pose_stack(
+    rolls: Sequence[float],
+    pitches: Sequence[float],
+    yaws: Sequence[float],
+) -> np.ndarray:
+    """Build head pose matrices for N orientations in one vectorized pass.
+
+    Args:
+        rolls: Roll angles in degrees
+        pitches: Pitch angles in degrees
+        yaws: Yaw angles in degrees
+
+    Returns:
+        Read-only (N, 4, 4) array of homogeneous transforms
+    """
+    rolls = np.asarray(rolls, dtype=np.float64)
+    out = _fill_pose(
+        np.empty((len(rolls), 4, 4)),
+        rolls,
+        np.asarray(pitches, dtype=np.float64),
+        np.asarray(yaws, dtype=np.float64),
+    )
+    out.setflags(write=False)
+    return out
+
+
+def _make_pose(roll: float, pitch: float, yaw: float) -> np.ndarray:
+    """Create a read-only head pose matrix from angles in degrees."""
+    pose = _fill_pose(np.empty((4, 4)), roll, pitch, yaw)
+    pose.setflags(write=False)
+    return pose
+
+
+# Head pose matrices keyed by (roll, pitch, yaw), built once at import
+_POSE_CACHE: Dict[Tuple[float, float, float], np.ndarray] = dict(
+    zip(_STATIC_POSE_ANGLES, _build_pose_stack(*zip(*_STATIC_POSE_ANGLES)))
+)
+
+# Neutral head pose, shared by every "return to center" move
+_IDENTITY_POSE = _POSE_CACHE[(0, 0, 0)]
+
+
+def _build_gesture(spec) -> Tuple[StepRecord, ...]:
+    """Turn a gesture spec into step records, building all its poses at once.
+
+    Centered steps use the shared _IDENTITY_POSE.
+    """
+    angles = [step[0] for step in spec]
+    poses = _build_pose_stack(*zip(*angles))
+    return tuple(
+        StepRecord(
+            _IDENTITY_POSE if angle == (0, 0, 0) else pose, antennas, duration, dwell
+        )
+        for pose, (angle, antennas, duration, dwell) in zip(poses, spec)
+    )
+
+
+# Step records for every gesture, built once at import
+_GESTURES: Dict[str, Tuple[StepRecord, ...]] = {
+    name: _build_gesture(spec) for name, spec in _GESTURE_SPECS.items()
+}
+
+
+# Head pose for each move_head direction
+_DIRECTION_POSES: Dict[str, np.ndarray] = {
+    "left": _POSE_CACHE[(0, 0, 25)],      # yaw left
+    "right": _POSE_CACHE[(0, 0, -25)],    # yaw right
+    "up": _POSE_CACHE[(0, -20, 0)],       # pitch up
+    "down": _POSE_CACHE[(0, 20, 0)],      # pitch down
+    "center": _IDENTITY_POSE,             # neutral
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _precise_pose(roll: float, pitch: float, yaw: float) -> np.ndarray:
+    """Get the head pose for arbitrary angles, cached for repeated requests."""
+    if not (roll or pitch or yaw):
+        return _IDENTITY_POSE
+    return _make_pose(roll, pitch, yaw)
+
 
 class MovementController:
     """Controls Reachy Mini head movements and expressions."""
@@ -27,22 +262,225 @@ class MovementController:
         """
         self.robot = robot
 
+        # Bound once; called positionally as (head, antennas, duration)
+        self._goto = robot.goto_target
+
+        # Single worker dedicated to motion: serializes commands to the robot
+        # and keeps them off the default executor used for audio/camera I/O
+        self._motion_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="reachy-motion"
+        )
+
+        # Last head pose and antenna angles queued on the motion worker, or
+        # None when unknown (before the first move, after wake/sleep or errors)
+        self._last_head: Optional[np.ndarray] = None
+        self._last_antennas: Optional[Tuple[float, ...]] = None
+
+        # Errors raised by robot calls on the motion worker. They are logged
+        # from the event loop by a periodic drain, off the motion path.
+        self._motion_errors: Deque[Exception] = deque(maxlen=16)
+        self._drain_handle: Optional[asyncio.TimerHandle] = None
+
+    def close(self) -> None:
+        """Shut down the motion worker and log any errors not yet reported."""
+        if self._drain_handle is not None:
+            self._drain_handle.cancel()
+            self._drain_handle = None
+        self._log_motion_errors()
+        self._motion_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _record_motion_error(self, error: Exception) -> None:
+        """Queue a motion worker error for logging (runs on the motion worker)."""
+        self._forget_target()
+        self._motion_errors.append(error)
+
+    def _log_motion_errors(self) -> None:
+        """Log the errors recorded on the motion worker."""
+        while self._motion_errors:
+            logger.error("Motion error: %s", self._motion_errors.popleft())
+
+    def _schedule_error_drain(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the periodic error drain if it isn't running."""
+        if self._drain_handle is None:
+            self._drain_handle = loop.call_later(
+                _ERROR_LOG_INTERVAL, self._drain_motion_errors, loop
+            )
+
+    def _drain_motion_errors(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Log recorded errors, then check again after the next interval."""
+        self._drain_handle = None
+        self._log_motion_errors()
+        self._schedule_error_drain(loop)
+
+    def _guarded_blocking(self, func, *args) -> Optional[Exception]:
+        """Call a blocking robot method, recording instead of raising its error (runs on the motion worker).
+
+        Returns:
+            The exception raised, or None on success
+        """
+        try:
+            func(*args)
+        except Exception as e:
+            self._record_motion_error(e)
+            return e
+        return None
+
+    async def _run_motion(self, func, *args) -> Optional[Exception]:
+        """Run a blocking robot call on the motion worker.
+
+        Returns:
+            The exception the call raised, or None on success
+        """
+        loop = asyncio.get_running_loop()
+        self._schedule_error_drain(loop)
+        return await loop.run_in_executor(
+            self._motion_executor, self._guarded_blocking, func, *args
+        )
+
+    def _is_last_target(
+        self,
+        head: Optional[np.ndarray],
+        antennas: Optional[Sequence[float]],
+    ) -> bool:
+        """Check whether a move targets the pose and antennas last sent to the robot."""
+        if head is not None and head is not self._last_head and (
+            self._last_head is None or not np.array_equal(head, self._last_head)
+        ):
+            return False
+        if antennas is not None and tuple(antennas) != self._last_antennas:
+            return False
+        return True
+
+    def _fill_target(
+        self,
+        head: Optional[np.ndarray],
+        antennas: Optional[Sequence[float]],
+    ) -> Tuple[Optional[np.ndarray], Optional[Sequence[float]]]:
+        """Fill a missing head pose or antenna target from the last one sent.
+
+        The robot then gets both in one goto_target call, holding the part
+        that isn't changing.
+        """
+        if head is None:
+            head = self._last_head
+        if antennas is None:
+            antennas = self._last_antennas
+        return head, antennas
+
+    def _remember_target(
+        self,
+        head: Optional[np.ndarray],
+        antennas: Optional[Sequence[float]],
+    ) -> None:
+        """Record a move queued on the motion worker."""
+        if head is not None:
+            self._last_head = head
+        if antennas is not None:
+            self._last_antennas = tuple(antennas)
+
+    def _forget_target(self) -> None:
+        """Mark the robot's pose as unknown so the next move is always sent."""
+        self._last_head = None
+        self._last_antennas = None
+
     async def _goto_target(
         self,
         head: Optional[np.ndarray] = None,
-        antennas: Optional[list] = None,
+        antennas: Optional[Sequence[float]] = None,
         duration: float = 0.5,
     ) -> None:
-        """Wrapper for robot.goto_target that runs in executor (non-blocking async)."""
+        """Wrapper for robot.goto_target that runs on the motion worker (non-blocking async).
+
+        Moves to the target the robot was last sent to are skipped.
+        """
+        if self._is_last_target(head, antennas):
+            logger.debug("Already at target, skipping move")
+            return
+
+        head, antennas = self._fill_target(head, antennas)
+        self._remember_target(head, antennas)
+        await self._run_motion(self._goto, head, antennas, duration)
+
+    def _goto_and_hold_blocking(
+        self,
+        head: Optional[np.ndarray],
+        antennas: Optional[Sequence[float]],
+        duration: float,
+        end_offset: float,
+        anchor: List[Optional[float]],
+    ) -> None:
+        """Move to a target, then hold it until the step's scheduled end (runs on the motion worker).
+
+        Args:
+            head: Head pose matrix, or None to leave the head where it is
+            antennas: Antenna angles in radians, or None to leave them
+            duration: Movement duration in seconds
+            end_offset: Seconds from the start of the gesture to the end of this step
+            anchor: One-element list shared by a gesture's steps; the first step
+                to run stores the gesture's monotonic start time in it
+        """
         try:
-            await asyncio.to_thread(
-                self.robot.goto_target,
-                head=head,
-                antennas=antennas,
-                duration=duration,
-            )
+            if anchor[0] is None:
+                anchor[0] = time.monotonic()
+            self._goto(head, antennas, duration)
+
+            # Wait only for what is left of the step, absorbing any time the
+            # move overran so the error does not add up over the gesture
+            remaining = anchor[0] + end_offset - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
         except Exception as e:
-            logger.error(f"Motion error: {e}")
+            self._record_motion_error(e)
+
+    def _goto_target_nowait(
+        self,
+        head: Optional[np.ndarray],
+        antennas: Optional[Sequence[float]],
+        duration: float,
+        end_offset: float,
+        anchor: List[Optional[float]],
+    ) -> asyncio.Future:
+        """Queue a gesture step on the motion worker without waiting for it."""
+        head, antennas = self._fill_target(head, antennas)
+        self._remember_target(head, antennas)
+        loop = asyncio.get_running_loop()
+        self._schedule_error_drain(loop)
+        return loop.run_in_executor(
+            self._motion_executor,
+            self._goto_and_hold_blocking, head, antennas, duration, end_offset, anchor,
+        )
+
+    async def _play_steps(self, steps: Sequence[StepRecord]) -> None:
+        """Play a sequence of gesture steps.
+
+        Every step is queued on the motion worker up front, so each move starts
+        as soon as the previous one finishes instead of waiting for the event
+        loop to schedule it. Steps are timed against deadlines measured from the
+        start of the gesture. Cancelling the caller drops the steps not yet run.
+        """
+        anchor: List[Optional[float]] = [None]
+        end_offset = 0.0
+        futures = []
+        for head, antennas, duration, dwell in steps:
+            end_offset += duration + dwell
+            futures.append(
+                self._goto_target_nowait(head, antennas, duration, end_offset, anchor)
+            )
+
+        try:
+            await asyncio.gather(*futures)
+        except asyncio.CancelledError:
+            # Dropped steps never reach the robot, so its pose is no longer known
+            self._forget_target()
+            raise
+
+    async def _play_sequence(self, name: str) -> None:
+        """Play a gesture from the gesture table."""
+        await self._play_steps(_GESTURES[name])
+
+    async def _play_sequence_n(self, name: str, times: int) -> None:
+        """Play a gesture cycle `times` times, then return the head to center."""
+        await self._play_steps(_GESTURES[name] * times + _GESTURES["recenter"])
 
     async def move_head(
         self,
@@ -58,30 +496,13 @@ class MovementController:
         Returns:
             Status message
         """
-        # Define head poses for each direction (roll, pitch, yaw in degrees)
-        poses = {
-            "left": (0, 0, 25),      # yaw left
-            "right": (0, 0, -25),    # yaw right
-            "up": (0, -20, 0),       # pitch up
-            "down": (0, 20, 0),      # pitch down
-            "center": (0, 0, 0),     # neutral
-        }
-
-        if direction not in poses:
-            logger.warning(f"Unknown direction: {direction}, using center")
+        if direction not in _DIRECTION_POSES:
+            logger.warning("Unknown direction: %s, using center", direction)
             direction = "center"
 
-        roll, pitch, yaw = poses[direction]
+        pose = _DIRECTION_POSES[direction]
 
-        # Create head pose matrix
-        pose = create_head_pose(
-            roll=roll,
-            pitch=pitch,
-            yaw=yaw,
-            degrees=True,
-        )
-
-        logger.info(f"Moving head {direction}")
+        logger.info("Moving head %s", direction)
         await self._goto_target(head=pose, duration=duration)
         return f"Moved head {direction}"
 
@@ -104,18 +525,15 @@ class MovementController:
             Status message
         """
         # Clamp values to safe ranges
-        roll = max(-30, min(30, roll))
-        pitch = max(-30, min(30, pitch))
-        yaw = max(-45, min(45, yaw))
-
-        pose = create_head_pose(
-            roll=roll,
-            pitch=pitch,
-            yaw=yaw,
-            degrees=True,
-        )
+        roll = _clip(roll, -30, 30)
+        pitch = _clip(pitch, -30, 30)
+        yaw = _clip(yaw, -45, 45)
+
+        # Round to 0.1 degree so repeated requests hit the pose cache
+        roll, pitch, yaw = round(roll, 1), round(pitch, 1), round(yaw, 1)
+        pose = _precise_pose(roll, pitch, yaw)
 
-        logger.info(f"Moving head to roll={roll}, pitch={pitch}, yaw={yaw}")
+        logger.info("Moving head to roll=%s, pitch=%s, yaw=%s", roll, pitch, yaw)
         await self._goto_target(head=pose, duration=duration)
         return f"Moved head to roll={roll}, pitch={pitch}, yaw={yaw}"
 
@@ -136,11 +554,11 @@ class MovementController:
             Status message
         """
         # Convert degrees to radians and clamp to safe range
-        right_rad = max(-1.57, min(1.57, np.radians(right_angle)))
-        left_rad = max(-1.57, min(1.57, np.radians(left_angle)))
+        right_rad = _clip(right_angle * _DEG2RAD, -_ANT_LIMIT, _ANT_LIMIT)
+        left_rad = _clip(left_angle * _DEG2RAD, -_ANT_LIMIT, _ANT_LIMIT)
 
-        logger.info(f"Moving antennas: right={right_angle}, left={left_angle}")
-        await self._goto_target(antennas=[right_rad, left_rad], duration=duration)
+        logger.info("Moving antennas: right=%s, left=%s", right_angle, left_angle)
+        await self._goto_target(antennas=(right_rad, left_rad), duration=duration)
         return f"Moved antennas to right={right_angle}, left={left_angle} degrees"
 
     async def antenna_expression(self, expression: str) -> str:
@@ -152,19 +570,11 @@ class MovementController:
         Returns:
             Status message
         """
-        expressions = {
-            "neutral": [0, 0],
-            "alert": [0.8, -0.8],      # Both up/forward
-            "droopy": [-1.0, 1.0],     # Both down
-            "asymmetric": [0.5, 0.2],  # One up, one down
-            "perky": [1.0, -1.0],      # Both fully up
-        }
-
-        if expression not in expressions:
+        if expression not in _ANTENNA_PRESETS:
             expression = "neutral"
 
-        antennas = expressions[expression]
-        logger.info(f"Setting antenna expression: {expression}")
+        antennas = _ANTENNA_PRESETS[expression]
+        logger.info("Setting antenna expression: %s", expression)
         await self._goto_target(antennas=antennas, duration=0.3)
         return f"Set antennas to {expression}"
 
@@ -177,23 +587,9 @@ class MovementController:
         Returns:
             Status message
         """
-        times = max(1, min(5, times))
-        logger.info(f"Nodding yes {times} times")
-
-        for _ in range(times):
-            # Nod down
-            pose = create_head_pose(pitch=15, degrees=True)
-            await self._goto_target(head=pose, duration=0.15)
-            await asyncio.sleep(0.1)
-
-            # Nod up
-            pose = create_head_pose(pitch=-10, degrees=True)
-            await self._goto_target(head=pose, duration=0.15)
-            await asyncio.sleep(0.1)
-
-        # Return to center
-        pose = create_head_pose(degrees=True)
-        await self._goto_target(head=pose, duration=0.2)
+        times = _clip(times, 1, 5)
+        logger.info("Nodding yes %s times", times)
+        await self._play_sequence_n("nod", times)
         return f"Nodded yes {times} times"
 
     async def shake_no(self, times: int = 2) -> str:
@@ -205,23 +601,9 @@ class MovementController:
         Returns:
             Status message
         """
-        times = max(1, min(5, times))
-        logger.info(f"Shaking no {times} times")
-
-        for _ in range(times):
-            # Turn left
-            pose = create_head_pose(yaw=20, degrees=True)
-            await self._goto_target(head=pose, duration=0.15)
-            await asyncio.sleep(0.05)
-
-            # Turn right
-            pose = create_head_pose(yaw=-20, degrees=True)
-            await self._goto_target(head=pose, duration=0.15)
-            await asyncio.sleep(0.05)
-
-        # Return to center
-        pose = create_head_pose(degrees=True)
-        await self._goto_target(head=pose, duration=0.2)
+        times = _clip(times, 1, 5)
+        logger.info("Shaking no %s times", times)
+        await self._play_sequence_n("shake", times)
         return f"Shook head no {times} times"
 
     async def tilt_head(self, direction: str, angle: float = 20) -> str:
@@ -234,42 +616,40 @@ class MovementController:
         Returns:
             Status message
         """
-        angle = max(5, min(30, angle))
+        angle = _clip(angle, 5, 30)
         if direction == "left":
             roll = angle
         else:
             roll = -angle
 
-        pose = create_head_pose(roll=roll, degrees=True)
-        logger.info(f"Tilting head {direction} by {angle} degrees")
+        pose = _precise_pose(round(roll, 1), 0, 0)
+        logger.info("Tilting head %s by %s degrees", direction, angle)
         await self._goto_target(head=pose, duration=0.4)
         return f"Tilted head {direction}"
 
     async def look_at_camera(self) -> str:
         """Look directly at the camera (center position)."""
-        pose = create_head_pose(degrees=True)
-        await self._goto_target(head=pose, antennas=[0, 0], duration=0.3)
+        pose = _IDENTITY_POSE
+        await self._goto_target(head=pose, antennas=(0, 0), duration=0.3)
         return "Looking at camera"
 
     async def wake_up(self) -> str:
         """Perform wake up animation."""
         logger.info("Performing wake up animation")
-        try:
-            await asyncio.to_thread(self.robot.wake_up)
-            return "Woke up and ready!"
-        except Exception as e:
-            logger.error(f"Wake up error: {e}")
-            return f"Wake up failed: {e}"
+        self._forget_target()
+        error = await self._run_motion(self.robot.wake_up)
+        if error is not None:
+            return f"Wake up failed: {error}"
+        return "Woke up and ready!"
 
     async def go_to_sleep(self) -> str:
         """Perform sleep animation."""
         logger.info("Going to sleep")
-        try:
-            await asyncio.to_thread(self.robot.goto_sleep)
-            return "Going to sleep..."
-        except Exception as e:
-            logger.error(f"Sleep error: {e}")
-            return f"Sleep failed: {e}"
+        self._forget_target()
+        error = await self._run_motion(self.robot.goto_sleep)
+        if error is not None:
+            return f"Sleep failed: {error}"
+        return "Going to sleep..."
 
     async def express_emotion(self, emotion: str) -> str:
         """Express an emotion through movement.
@@ -281,161 +661,15 @@ class MovementController:
         Returns:
             Status message
         """
-        logger.info(f"Expressing emotion: {emotion}")
-
-        emotion_methods = {
-            "happy": self._happy_expression,
-            "sad": self._sad_expression,
-            "surprised": self._surprised_expression,
-            "curious": self._curious_expression,
-            "excited": self._excited_expression,
-            "sleepy": self._sleepy_expression,
-            "confused": self._confused_expression,
-            "angry": self._angry_expression,
-            "love": self._love_expression,
-        }
-
-        if emotion in emotion_methods:
-            await emotion_methods[emotion]()
+        logger.info("Expressing emotion: %s", emotion)
+
+        if emotion in _EMOTIONS:
+            await self._play_sequence(emotion)
             return f"Expressed {emotion}"
         else:
-            logger.warning(f"Unknown emotion: {emotion}")
+            logger.warning("Unknown emotion: %s", emotion)
             return f"Unknown emotion: {emotion}"
 
-    async def _happy_expression(self) -> None:
-        """Express happiness with a head wiggle and antenna bounce."""
-        # Quick head tilt right
-        pose = create_head_pose(roll=15, degrees=True)
-        await self._goto_target(head=pose, antennas=[0.5, -0.5], duration=0.2)
-        await asyncio.sleep(0.15)
-
-        # Quick head tilt left
-        pose = create_head_pose(roll=-15, degrees=True)
-        await self._goto_target(head=pose, antennas=[-0.5, 0.5], duration=0.2)
-        await asyncio.sleep(0.15)
-
-        # Back to center with perky antennas
-        pose = create_head_pose(degrees=True)
-        await self._goto_target(head=pose, antennas=[0.3, -0.3], duration=0.2)
-
-    async def _sad_expression(self) -> None:
-        """Express sadness with droopy head and antennas."""
-        # Look down with droopy antennas
-        pose = create_head_pose(pitch=25, degrees=True)
-        await self._goto_target(head=pose, antennas=[-1.2, 1.2], duration=0.8)
-        await asyncio.sleep(0.8)
-
-        # Slowly return to slightly droopy neutral
-        pose = create_head_pose(pitch=5, degrees=True)
-        await self._goto_target(head=pose, antennas=[-0.3, 0.3], duration=0.5)
-
-    async def _surprised_expression(self) -> None:
-        """Express surprise with quick look up and antenna pop."""
-        # Quick look up with antennas up
-        pose = create_head_pose(pitch=-20, degrees=True)
-        await self._goto_target(head=pose, antennas=[1.0, -1.0], duration=0.12)
-        await asyncio.sleep(0.4)
-
-        # Return to neutral with slightly raised antennas
-        pose = create_head_pose(degrees=True)
-        await self._goto_target(head=pose, antennas=[0.3, -0.3], duration=0.3)
-
-    async def _curious_expression(self) -> None:
-        """Express curiosity with head tilt."""
-        # Tilt head to side with one antenna up
-        pose = create_head_pose(roll=20, pitch=-10, degrees=True)
-        await self._goto_target(head=pose, antennas=[0.6, 0.1], duration=0.4)
-        await asyncio.sleep(0.5)
-
-        # Return to neutral
-        pose = create_head_pose(degrees=True)
-        await self._goto_target(head=pose, antennas=[0, 0], duration=0.3)
-
-    async def _excited_expression(self) -> None:
-        """Express excitement with bouncy movements."""
-        for _ in range(3):
-            # Quick up
-            pose = create_head_pose(pitch=-10, degrees=True)
-            await self._goto_target(head=pose, antennas=[0.8, -0.8], duration=0.1)
-            await asyncio.sleep(0.08)
-
-            # Quick down
-            pose = create_head_pose(pitch=5, degrees=True)
-            await self._goto_target(head=pose, antennas=[-0.2, 0.2], duration=0.1)
-            await asyncio.sleep(0.08)
-
-        # End with perky pose
-        pose = create_head_pose(degrees=True)
-        await self._goto_target(head=pose, antennas=[0.5, -0.5], duration=0.2)
-
-    async def _sleepy_expression(self) -> None:
-        """Express sleepiness with slow droopy movement."""
-        # Slowly droop head and antennas
-        pose = create_head_pose(pitch=25, roll=8, degrees=True)
-        await self._goto_target(head=pose, antennas=[-1.3, 1.3], duration=1.2)
-        await asyncio.sleep(0.5)
-
-        # Small "nod off" movement
-        pose = create_head_pose(pitch=30, roll=8, degrees=True)
-        await self._goto_target(head=pose, duration=0.3)
-        await asyncio.sleep(0.3)
-
-        # Wake up slightly
-        pose = create_head_pose(pitch=15, degrees=True)
-        await self._goto_target(head=pose, antennas=[-0.8, 0.8], duration=0.4)
-
-    async def _confused_expression(self) -> None:
-        """Express confusion with head tilts and asymmetric antennas."""
-        # Tilt one way
-        pose = create_head_pose(roll=15, pitch=-5, degrees=True)
-        await self._goto_target(head=pose, antennas=[0.4, 0.6], duration=0.3)
-        await asyncio.sleep(0.3)
-
-        # Tilt other way
-        pose = create_head_pose(roll=-15, pitch=-5, degrees=True)
-        await self._goto_target(head=pose, antennas=[0.6, 0.4], duration=0.3)
-        await asyncio.sleep(0.3)
-
-        # Return to slightly confused pose
-        pose = create_head_pose(roll=8, degrees=True)
-        await self._goto_target(head=pose, antennas=[0.2, 0.4], duration=0.25)
-
-    async def _angry_expression(self) -> None:
-        """Express anger with aggressive movements."""
-        # Look down intensely
-        pose = create_head_pose(pitch=10, degrees=True)
-        await self._goto_target(head=pose, antennas=[0.8, -0.8], duration=0.2)
-        await asyncio.sleep(0.2)
-
-        # Quick shake
-        pose = create_head_pose(yaw=10, pitch=10, degrees=True)
-        await self._goto_target(head=pose, duration=0.1)
-        await asyncio.sleep(0.1)
-
-        pose = create_head_pose(yaw=-10, pitch=10, degrees=True)
-        await self._goto_target(head=pose, duration=0.1)
-        await asyncio.sleep(0.1)
-
-        # Return to stern pose
-        pose = create_head_pose(pitch=5, degrees=True)
-        await self._goto_target(head=pose, antennas=[0.5, -0.5], duration=0.2)
-
-    async def _love_expression(self) -> None:
-        """Express love/affection with gentle movements."""
-        # Gentle tilt with soft antenna pose
-        pose = create_head_pose(roll=12, pitch=-8, degrees=True)
-        await self._goto_target(head=pose, antennas=[0.4, -0.4], duration=0.5)
-        await asyncio.sleep(0.4)
-
-        # Other side
-        pose = create_head_pose(roll=-12, pitch=-8, degrees=True)
-        await self._goto_target(head=pose, antennas=[-0.4, 0.4], duration=0.5)
-        await asyncio.sleep(0.4)
-
-        # Return to happy neutral
-        pose = create_head_pose(degrees=True)
-        await self._goto_target(head=pose, antennas=[0.2, -0.2], duration=0.3)
-
     async def do_dance(self, style: str = "default") -> str:
         """Perform a short dance animation.
 
@@ -445,36 +679,13 @@ class MovementController:
         Returns:
             Status message
         """
-        logger.info(f"Dancing: {style}")
-
-        if style == "silly":
-            # Silly dance with exaggerated movements
-            for _ in range(2):
-                pose = create_head_pose(roll=25, yaw=15, degrees=True)
-                await self._goto_target(head=pose, antennas=[1.0, 0], duration=0.2)
-                await asyncio.sleep(0.15)
-
-                pose = create_head_pose(roll=-25, yaw=-15, degrees=True)
-                await self._goto_target(head=pose, antennas=[0, -1.0], duration=0.2)
-                await asyncio.sleep(0.15)
-        else:
-            # Default/happy dance
-            for _ in range(3):
-                pose = create_head_pose(roll=15, pitch=-5, degrees=True)
-                await self._goto_target(head=pose, antennas=[0.6, -0.6], duration=0.15)
-                await asyncio.sleep(0.1)
-
-                pose = create_head_pose(roll=-15, pitch=-5, degrees=True)
-                await self._goto_target(head=pose, antennas=[-0.6, 0.6], duration=0.15)
-                await asyncio.sleep(0.1)
-
-        # Return to neutral
-        pose = create_head_pose(degrees=True)
-        await self._goto_target(head=pose, antennas=[0, 0], duration=0.25)
+        logger.info("Dancing: %s", style)
+
+        await self._play_sequence("dance_silly" if style == "silly" else "dance")
         return f"Finished {style} dance"
 
     async def reset_position(self) -> str:
         """Reset head and antennas to neutral position."""
-        pose = create_head_pose(degrees=True)
-        await self._goto_target(head=pose, antennas=[0, 0], duration=0.5)
+        pose = _IDENTITY_POSE
+        await self._goto_target(head=pose, antennas=(0, 0), duration=0.5)
         return "Reset to neutral position"
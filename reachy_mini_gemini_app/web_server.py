@@ -1,106 +1,325 @@
 """Web server for Reachy Mini Gemini App settings page."""
 
+import functools
+import io
 import json
 import logging
+import mimetypes
+import socket
 import threading
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Optional
-from urllib.parse import parse_qs, urlparse
+from typing import Dict, Optional, Set, Tuple
+from urllib.parse import urlparse
 
-from reachy_mini_gemini_app.config import get_settings_for_api, save_settings
+from reachy_mini_gemini_app.config import (
+    dumps_json,
+    flush_settings,
+    get_settings_api_bytes,
+    loads_json,
+    queue_settings_update,
+)
 
 logger = logging.getLogger(__name__)
 
 # Static files directory
 STATIC_DIR = Path(__file__).parent / "static"
 
-# Default port for the settings server
+# Default address and port for the settings server. Binding to loopback keeps
+# the page local; pass host="0.0.0.0" to expose it on the network.
+DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 8042
 
+# Maximum number of connections handled concurrently
+MAX_WORKERS = 8
 
-class SettingsHandler(SimpleHTTPRequestHandler):
-    """HTTP handler for the settings API and static files."""
+# Most connections accepted and not yet finished; further ones are closed at once
+MAX_PENDING = 4 * MAX_WORKERS
 
-    def __init__(self, *args, **kwargs):
-        # Set the directory to serve static files from
-        super().__init__(*args, directory=str(STATIC_DIR), **kwargs)
+# Status line and headers for JSON replies, filled in with the body length
+JSON_RESPONSE_HEAD = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: %d\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"\r\n"
+)
+
+# Fully formed response for GET /api/health, which never changes
+HEALTH_BODY = b'{"status": "ok"}'
+HEALTH_RESPONSE = JSON_RESPONSE_HEAD % len(HEALTH_BODY) + HEALTH_BODY
+
+# Fully formed CORS preflight response
+OPTIONS_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+    b"Access-Control-Allow-Headers: Content-Type\r\n"
+    b"Content-Length: 0\r\n"
+    b"\r\n"
+)
+
+# Largest accepted POST body; settings payloads are a few hundred bytes
+MAX_BODY_SIZE = 64 * 1024
+
+# Seconds an idle keep-alive connection may hold a worker before it is closed
+KEEPALIVE_TIMEOUT = 5.0
+
+
+class SettingsHandler(BaseHTTPRequestHandler):
+    """HTTP handler for the settings API and static files.
+
+    Requests are dispatched through fixed route tables; static files are the
+    ones preloaded into the server at start.
+    """
+
+    # Keep connections open so the page and its API calls share one socket
+    protocol_version = "HTTP/1.1"
+    timeout = KEEPALIVE_TIMEOUT
+
+    def setup(self):
+        """Disable Nagle's algorithm so small JSON replies go out immediately."""
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self):
+        """Serve requests on the connection, letting it go when others are waiting for a worker."""
+        self.handle_one_request()
+        while not self.close_connection and not self.server.backlogged:
+            self.handle_one_request()
 
     def log_message(self, format, *args):
-        """Override to use our logger."""
-        logger.debug(f"HTTP: {format % args}")
+        """Override to use our logger, formatting only when debug logging is on."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("HTTP: " + format, *args)
 
     def do_GET(self):
         """Handle GET requests."""
-        parsed = urlparse(self.path)
+        path = urlparse(self.path).path
+
+        route = self._GET_ROUTES.get(path)
+        if route is not None:
+            route(self)
+            return
 
-        if parsed.path == "/api/settings":
-            self._handle_get_settings()
-        elif parsed.path == "/api/health":
-            self._send_json({"status": "ok"})
+        static_file = self.server.static_files.get(path)
+        if static_file is not None:
+            self._send_static(*static_file)
         else:
-            # Serve static files
-            super().do_GET()
+            self.send_error(404, "Not Found")
+
+    def do_HEAD(self):
+        """Handle HEAD requests with the headers of the matching GET response."""
+        wfile = self.wfile
+        self.wfile = io.BytesIO()
+        try:
+            self.do_GET()
+        finally:
+            response, self.wfile = self.wfile.getvalue(), wfile
+
+        head, separator, _ = response.partition(b"\r\n\r\n")
+        wfile.write(head + separator)
 
     def do_POST(self):
         """Handle POST requests."""
-        parsed = urlparse(self.path)
-
-        if parsed.path == "/api/settings":
-            self._handle_post_settings()
+        route = self._POST_ROUTES.get(urlparse(self.path).path)
+        if route is not None:
+            route(self)
         else:
             self.send_error(404, "Not Found")
 
+    def _handle_health(self):
+        """Report that the server is up."""
+        self.log_request(200)
+        self.wfile.write(HEALTH_RESPONSE)
+
     def _handle_get_settings(self):
         """Return current settings."""
-        settings = get_settings_for_api()
-        self._send_json(settings)
+        self._send_json_bytes(get_settings_api_bytes())
 
     def _handle_post_settings(self):
         """Save new settings."""
         try:
             content_length = int(self.headers.get("Content-Length", 0))
-            body = self.rfile.read(content_length)
-            new_settings = json.loads(body.decode("utf-8"))
+        except ValueError:
+            self.send_error(400, "Invalid Content-Length")
+            return
+
+        if content_length < 0:
+            self.send_error(400, "Invalid Content-Length")
+            return
+        if content_length > MAX_BODY_SIZE:
+            self.send_error(413, "Request body too large")
+            return
+
+        body = self._read_body(content_length)
+        if body is None:
+            self.send_error(400, "Incomplete request body")
+            return
+
+        try:
+            new_settings = loads_json(body)
 
             # Remove undefined/null values
             new_settings = {k: v for k, v in new_settings.items() if v is not None}
 
-            if save_settings(new_settings):
-                self._send_json({"success": True})
-            else:
-                self.send_error(500, "Failed to save settings")
+            queue_settings_update(new_settings)
+            self._send_json({"success": True})
         except json.JSONDecodeError:
             self.send_error(400, "Invalid JSON")
         except Exception as e:
             logger.error(f"Error saving settings: {e}")
             self.send_error(500, str(e))
 
-    def _send_json(self, data: dict):
-        """Send a JSON response."""
-        response = json.dumps(data).encode("utf-8")
+    def _read_body(self, length: int) -> Optional[bytearray]:
+        """Read exactly `length` body bytes into a preallocated buffer.
+
+        Returns:
+            The body, or None if the client closed the connection early
+        """
+        body = bytearray(length)
+        view = memoryview(body)
+        offset = 0
+        while offset < length:
+            count = self.rfile.readinto(view[offset:])
+            if not count:
+                return None
+            offset += count
+        return body
+
+    def _send_static(self, body: bytes, content_type: str):
+        """Send a preloaded static file."""
         self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", len(response))
-        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", len(body))
         self.end_headers()
-        self.wfile.write(response)
+        self.wfile.write(body)
+
+    def _send_json(self, data: dict):
+        """Send a JSON response."""
+        self._send_json_bytes(dumps_json(data))
+
+    def _send_json_bytes(self, body: bytes):
+        """Send an already-encoded JSON response in a single write."""
+        self.log_request(200)
+        self.wfile.write(JSON_RESPONSE_HEAD % len(body) + body)
 
     def do_OPTIONS(self):
         """Handle CORS preflight requests."""
-        self.send_response(200)
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
-        self.end_headers()
+        self.log_request(200)
+        self.wfile.write(OPTIONS_RESPONSE)
+
+    _GET_ROUTES = {
+        "/api/settings": _handle_get_settings,
+        "/api/health": _handle_health,
+    }
+    _POST_ROUTES = {
+        "/api/settings": _handle_post_settings,
+    }
+
+
+def load_static_files(directory: Path = STATIC_DIR) -> Dict[str, Tuple[bytes, str]]:
+    """Read every file under the static directory into memory.
+
+    Returns:
+        Mapping of URL path to (body, content type). Directory index files are
+        also registered under the directory's own path (e.g. "/").
+    """
+    static_files: Dict[str, Tuple[bytes, str]] = {}
+
+    for path in sorted(directory.rglob("*")):
+        if not path.is_file():
+            continue
+
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        entry = (path.read_bytes(), content_type)
+        url_path = "/" + path.relative_to(directory).as_posix()
+        static_files[url_path] = entry
+
+        if path.name == "index.html":
+            static_files[url_path[: -len("index.html")]] = entry
+
+    return static_files
+
+
+class PooledHTTPServer(ThreadingHTTPServer):
+    """HTTP server that handles requests on a bounded pool of worker threads.
+
+    A keep-alive connection holds its worker until the client closes it or it
+    sits idle for KEEPALIVE_TIMEOUT. Handlers stop keeping connections alive
+    while others are queued for a worker, so a queued connection waits at most
+    about KEEPALIVE_TIMEOUT. Connections beyond max_pending are closed unserved.
+    """
+
+    def __init__(
+        self,
+        *args,
+        max_workers: int = MAX_WORKERS,
+        max_pending: int = MAX_PENDING,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.static_files: Dict[str, Tuple[bytes, str]] = {}
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="settings-http"
+        )
+        # Sockets of connections accepted and not yet finished
+        self._connections: Set[socket.socket] = set()
+        self._connections_lock = threading.Lock()
+
+    @property
+    def backlogged(self) -> bool:
+        """Whether accepted connections are waiting for a free worker."""
+        return len(self._connections) > self.max_workers
+
+    def process_request(self, request, client_address):
+        """Dispatch the request onto the worker pool, or close it if the queue is full."""
+        with self._connections_lock:
+            accepted = len(self._connections) < self.max_pending
+            if accepted:
+                self._connections.add(request)
+
+        if not accepted:
+            self.shutdown_request(request)
+            return
+
+        future = self.executor.submit(self.process_request_thread, request, client_address)
+        future.add_done_callback(functools.partial(self._request_done, request))
+
+    def _request_done(self, request, future):
+        """Forget a finished connection, closing it if it was never served."""
+        with self._connections_lock:
+            self._connections.discard(request)
+        if future.cancelled():
+            self.shutdown_request(request)
+
+    def server_close(self):
+        """Close the listening socket, stop the worker pool and drop open connections."""
+        super().server_close()
+        # Queued connections are closed by _request_done as they are cancelled
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+        # Wake workers blocked reading idle keep-alive connections, so the
+        # pool threads exit now rather than after KEEPALIVE_TIMEOUT
+        with self._connections_lock:
+            connections = list(self._connections)
+        for request in connections:
+            try:
+                request.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
 
 
 class SettingsServer:
     """Settings web server that runs in a background thread."""
 
-    def __init__(self, port: int = DEFAULT_PORT):
+    def __init__(self, port: int = DEFAULT_PORT, host: str = DEFAULT_HOST):
+        self.host = host
         self.port = port
-        self.server: Optional[HTTPServer] = None
+        self.server: Optional[PooledHTTPServer] = None
         self.thread: Optional[threading.Thread] = None
 
     def start(self) -> str:
@@ -109,7 +328,8 @@ class SettingsServer:
             return self.get_url()
 
         try:
-            self.server = HTTPServer(("0.0.0.0", self.port), SettingsHandler)
+            self.server = PooledHTTPServer((self.host, self.port), SettingsHandler)
+            self.server.static_files = load_static_files()
             self.thread = threading.Thread(target=self._run, daemon=True)
             self.thread.start()
             logger.info(f"Settings server started at {self.get_url()}")
@@ -127,24 +347,25 @@ class SettingsServer:
         """Stop the settings server."""
         if self.server:
             self.server.shutdown()
+            self.server.server_close()
             self.server = None
             self.thread = None
             logger.info("Settings server stopped")
 
     def get_url(self) -> str:
         """Get the server URL."""
-        return f"http://0.0.0.0:{self.port}"
+        return f"http://{self.host}:{self.port}"
 
 
 # Global server instance
 _server: Optional[SettingsServer] = None
 
 
-def start_settings_server(port: int = DEFAULT_PORT) -> str:
+def start_settings_server(port: int = DEFAULT_PORT, host: str = DEFAULT_HOST) -> str:
     """Start the global settings server."""
     global _server
     if _server is None:
-        _server = SettingsServer(port)
+        _server = SettingsServer(port, host)
     return _server.start()
 
 
@@ -154,3 +375,4 @@ def stop_settings_server():
     if _server:
         _server.stop()
         _server = None
+    flush_settings()